@@ -91,7 +91,7 @@ class FMPEarningsCallTranscriptFetcher(
 
         api_key = credentials.get("fmp_api_key") if credentials else ""
 
-        available_symbols = get_available_transcript_symbols(api_key=api_key)
+        available_symbols = await get_available_transcript_symbols(api_key=api_key)
         avail_df = DataFrame(available_symbols)
 
         if query.symbol.upper() not in avail_df["symbol"].values:
@@ -101,7 +101,7 @@ class FMPEarningsCallTranscriptFetcher(
                     + f"\n Available symbols include: {', '.join(sorted(avail_df['symbol'].unique().tolist()))}"
                 )
             )
-        symbol_transcripts = get_transcript_dates_for_symbol(
+        symbol_transcripts = await get_transcript_dates_for_symbol(
             query.symbol.upper(), api_key=api_key
         )
 
@@ -2,7 +2,10 @@
 
 # pylint: disable=unused-argument
 
+import math
+from operator import itemgetter
 from typing import Any
+from urllib.parse import urlencode
 
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.insider_trading import (
@@ -10,7 +13,8 @@ from openbb_core.provider.standard_models.insider_trading import (
     InsiderTradingQueryParams,
 )
 from openbb_fmp.utils.definitions import TRANSACTION_TYPES, TRANSACTION_TYPES_DICT
-from pydantic import Field, field_validator
+from openbb_fmp.utils.helpers import get_data_many, get_data_urls, sort_newest_first
+from pydantic import Field, TypeAdapter, field_validator
 
 
 class FMPInsiderTradingQueryParams(InsiderTradingQueryParams):
@@ -108,6 +112,9 @@ class FMPInsiderTradingData(InsiderTradingData):
     )
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPInsiderTradingData])
+
+
 class FMPInsiderTradingFetcher(
     Fetcher[
         FMPInsiderTradingQueryParams,
@@ -128,11 +135,6 @@ class FMPInsiderTradingFetcher(
         **kwargs: Any,
     ) -> list:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        import math  # noqa
-        from openbb_core.provider.utils.helpers import get_querystring
-        from openbb_fmp.utils.helpers import get_data_urls, get_data_many
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
 
         if query.statistics is True:
@@ -147,34 +149,37 @@ class FMPInsiderTradingFetcher(
             if query.transaction_type
             else None
         )
-        limit = query.limit if query.limit and query.limit <= 1000 else 1000
-        query = query.model_copy(update={"transaction_type": transaction_type})
+        # FMP caps each page at 1000 rows, so larger limits are split into
+        # independent pages which are fetched concurrently.
+        total = query.limit or 1000
+        per_page = min(total, 1000)
+        params = query.model_dump(by_alias=True, exclude_none=True, exclude={"limit"})
+        params.pop("transactionType", None)
+        if transaction_type:
+            params["transactionType"] = transaction_type
+        params.update({"limit": per_page, "apikey": api_key})
         base_url = "https://financialmodelingprep.com/stable/insider-trading/search"
-        query_str = get_querystring(query.model_dump(by_alias=True), ["page", "limit"])
 
-        pages = math.ceil(limit / 1000)
+        pages = math.ceil(total / per_page)
         urls = [
-            f"{base_url}?{query_str}&page={page}&limit={limit}&apikey={api_key}"
-            for page in range(pages)
+            f"{base_url}?{urlencode({**params, 'page': page})}" for page in range(pages)
         ]
+        data = await get_data_urls(urls, **kwargs)
 
-        return await get_data_urls(urls, **kwargs)  # type: ignore
+        return data[:total]  # type: ignore
 
     @staticmethod
     def transform_data(
         query: FMPInsiderTradingQueryParams, data: list, **kwargs: Any
     ) -> list[FMPInsiderTradingData]:
         """Return the transformed data."""
-        return (
-            [
-                FMPInsiderTradingData.model_validate(d)
-                for d in sorted(data, key=lambda x: x["filingDate"], reverse=True)
-            ]
-            if query.statistics is False
-            else [
-                FMPInsiderTradingData.model_validate(d)
-                for d in sorted(
-                    data, key=lambda x: (x["year"], x["quarter"]), reverse=True
-                )
-            ]
+        sort_newest_first(
+            data,
+            (
+                itemgetter("filingDate")
+                if query.statistics is False
+                else itemgetter("year", "quarter")
+            ),
         )
+
+        return _DATA_ADAPTER.validate_python(data)
@@ -2,6 +2,7 @@
 
 # pylint: disable=unused-argument
 
+from datetime import date
 from typing import Any
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -9,8 +10,8 @@ from openbb_core.provider.standard_models.institutional_ownership import (
     InstitutionalOwnershipData,
     InstitutionalOwnershipQueryParams,
 )
-from openbb_fmp.utils.helpers import get_data_urls
-from pydantic import Field, field_validator
+from openbb_fmp.utils.helpers import get_data_urls, most_recent_quarter
+from pydantic import Field, TypeAdapter, field_validator
 
 
 class FMPInstitutionalOwnershipQueryParams(InstitutionalOwnershipQueryParams):
@@ -154,6 +155,9 @@ class FMPInstitutionalOwnershipData(InstitutionalOwnershipData):
         return v / 100 if v else None
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPInstitutionalOwnershipData])
+
+
 class FMPInstitutionalOwnershipFetcher(
     Fetcher[
         FMPInstitutionalOwnershipQueryParams,
@@ -174,26 +178,24 @@ class FMPInstitutionalOwnershipFetcher(
         **kwargs: Any,
     ) -> list:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        from pandas import Timestamp, offsets
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
         symbols = query.symbol.split(",")
         year = query.year if query.year else None
         quarter = query.quarter if query.quarter else None
 
         if year is None and quarter is None:
-            current = (Timestamp("now") + offsets.QuarterEnd()) - offsets.QuarterEnd()
-            quarter = current.quarter
+            current = most_recent_quarter()
+            quarter = (current.month - 1) // 3 + 1
             year = current.year
         elif year is None and quarter is not None:
-            year = Timestamp("now").year
+            year = date.today().year
         elif year is not None and quarter is None:
-            current = Timestamp("now")
+            today = date.today()
+            current_quarter = (today.month - 1) // 3 + 1
             quarter = (
                 4
-                if year < current.year
-                else current.quarter - 1 if current.quarter > 1 else 1
+                if year < today.year
+                else current_quarter - 1 if current_quarter > 1 else 1
             )
 
         urls: list[str] = [
@@ -202,6 +204,9 @@ class FMPInstitutionalOwnershipFetcher(
             for symbol in symbols
         ]
 
+        # Cap the in-flight requests so long symbol lists don't trip FMP rate limits.
+        kwargs.setdefault("max_concurrency", 10)
+
         return await get_data_urls(urls, **kwargs)  # type: ignore
 
     @staticmethod
@@ -209,4 +214,4 @@ class FMPInstitutionalOwnershipFetcher(
         query: FMPInstitutionalOwnershipQueryParams, data: list, **kwargs: Any
     ) -> list[FMPInstitutionalOwnershipData]:
         """Return the transformed data."""
-        return [FMPInstitutionalOwnershipData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
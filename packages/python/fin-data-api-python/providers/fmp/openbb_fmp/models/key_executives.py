@@ -9,7 +9,8 @@ from openbb_core.provider.standard_models.key_executives import (
     KeyExecutivesData,
     KeyExecutivesQueryParams,
 )
-from pydantic import ConfigDict
+from openbb_fmp.utils.helpers import get_data_many
+from pydantic import ConfigDict, TypeAdapter
 
 
 class FMPKeyExecutivesQueryParams(KeyExecutivesQueryParams):
@@ -25,6 +26,9 @@ class FMPKeyExecutivesData(KeyExecutivesData):
     model_config = ConfigDict(extra="ignore")
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPKeyExecutivesData])
+
+
 class FMPKeyExecutivesFetcher(
     Fetcher[
         FMPKeyExecutivesQueryParams,
@@ -45,9 +49,6 @@ class FMPKeyExecutivesFetcher(
         **kwargs: Any,
     ) -> list[dict]:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        from openbb_fmp.utils.helpers import get_data_many
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
         base_url = "https://financialmodelingprep.com/stable"
         url = f"{base_url}/key-executives?symbol={query.symbol}&apikey={api_key}"
@@ -59,4 +60,4 @@ class FMPKeyExecutivesFetcher(
         query: FMPKeyExecutivesQueryParams, data: list[dict], **kwargs: Any
     ) -> list[FMPKeyExecutivesData]:
         """Return the transformed data."""
-        return [FMPKeyExecutivesData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
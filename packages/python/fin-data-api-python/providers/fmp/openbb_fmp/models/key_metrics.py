@@ -2,7 +2,11 @@
 
 # pylint: disable=unused-argument
 
+import asyncio
+import warnings
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from typing import Any, Literal
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -10,9 +14,10 @@ from openbb_core.provider.standard_models.key_metrics import (
     KeyMetricsData,
     KeyMetricsQueryParams,
 )
-from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.errors import EmptyDataError, UnauthorizedError
 from openbb_fmp.utils.definitions import FinancialPeriods
-from pydantic import Field
+from openbb_fmp.utils.helpers import get_data_many, sort_newest_first
+from pydantic import Field, TypeAdapter
 
 
 class FMPKeyMetricsQueryParams(KeyMetricsQueryParams):
@@ -47,47 +52,6 @@ class FMPKeyMetricsData(KeyMetricsData):
         "period_ending": "date",
         "fiscal_period": "period",
         "currency": "reportedCurrency",
-        "enterprise_value": "enterpriseValueTTM",
-        "ev_to_sales": "evToSalesTTM",
-        "ev_to_operating_cash_flow": "evToOperatingCashFlowTTM",
-        "ev_to_free_cash_flow": "evToFreeCashFlowTTM",
-        "ev_to_ebitda": "evToEBITDATTM",
-        "net_debt_to_ebitda": "netDebtToEBITDATTM",
-        "current_ratio": "currentRatioTTM",
-        "income_quality": "incomeQualityTTM",
-        "graham_number": "grahamNumberTTM",
-        "graham_net_net": "grahamNetNetTTM",
-        "tax_burden": "taxBurdenTTM",
-        "interest_burden": "interestBurdenTTM",
-        "working_capital": "workingCapitalTTM",
-        "invested_capital": "investedCapitalTTM",
-        "return_on_assets": "returnOnAssetsTTM",
-        "operating_return_on_assets": "operatingReturnOnAssetsTTM",
-        "return_on_tangible_assets": "returnOnTangibleAssetsTTM",
-        "return_on_equity": "returnOnEquityTTM",
-        "return_on_invested_capital": "returnOnInvestedCapitalTTM",
-        "return_on_capital_employed": "returnOnCapitalEmployedTTM",
-        "earnings_yield": "earningsYieldTTM",
-        "free_cash_flow_yield": "freeCashFlowYieldTTM",
-        "capex_to_operating_cash_flow": "capexToOperatingCashFlowTTM",
-        "capex_to_depreciation": "capexToDepreciationTTM",
-        "capex_to_revenue": "capexToRevenueTTM",
-        "sales_general_and_administrative_to_revenue": "salesGeneralAndAdministrativeToRevenueTTM",
-        "research_and_developement_to_revenue": "researchAndDevelopementToRevenueTTM",
-        "stock_based_compensation_to_revenue": "stockBasedCompensationToRevenueTTM",
-        "intangibles_to_total_assets": "intangiblesToTotalAssetsTTM",
-        "average_receivables": "averageReceivablesTTM",
-        "average_payables": "averagePayablesTTM",
-        "average_inventory": "averageInventoryTTM",
-        "days_of_sales_outstanding": "daysOfSalesOutstandingTTM",
-        "days_of_payables_outstanding": "daysOfPayablesOutstandingTTM",
-        "days_of_inventory_outstanding": "daysOfInventoryOutstandingTTM",
-        "operating_cycle": "operatingCycleTTM",
-        "cash_conversion_cycle": "cashConversionCycleTTM",
-        "free_cash_flow_to_equity": "freeCashFlowToEquityTTM",
-        "free_cash_flow_to_firm": "freeCashFlowToFirmTTM",
-        "tangible_asset_value": "tangibleAssetValueTTM",
-        "net_current_asset_value": "netCurrentAssetValueTTM",
     }
 
     enterprise_value: int | float | None = Field(
@@ -231,6 +195,9 @@ class FMPKeyMetricsData(KeyMetricsData):
     )
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPKeyMetricsData])
+
+
 class FMPKeyMetricsFetcher(
     Fetcher[
         FMPKeyMetricsQueryParams,
@@ -253,49 +220,68 @@ class FMPKeyMetricsFetcher(
         **kwargs: Any,
     ) -> list[dict]:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        import asyncio  # noqa
-        import warnings
-        from openbb_fmp.utils.helpers import get_data_many
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
         symbols = query.symbol.split(",")
-        results: list = []
         base_url: str = "https://financialmodelingprep.com/stable/key-metrics"
         limit = query.limit if query.limit and query.ttm != "only" else 1
+        today = datetime.today()
+        today_iso = today.date().isoformat()
 
-        async def get_one(symbol):
+        async def get_one(symbol) -> list[dict]:
             """Get data for one symbol."""
             ttm = f"{base_url}-ttm?symbol={symbol}&apikey={api_key}"
             metrics = f"{base_url}?symbol={symbol}&period={query.period}&limit={limit}&apikey={api_key}"
             result: list = []
-            ttm_data = await get_data_many(ttm, **kwargs)
-            metrics_data = await get_data_many(metrics, **kwargs)
-            currency = None
+            ttm_data, metrics_data = await asyncio.gather(
+                get_data_many(ttm, **kwargs),
+                get_data_many(metrics, **kwargs),
+                return_exceptions=True,
+            )
+
+            for leg in (ttm_data, metrics_data):
+                if isinstance(leg, UnauthorizedError):
+                    raise leg
 
-            if metrics_data:
-                if query.ttm != "only":
-                    result.extend(metrics_data)
-                currency = metrics_data[0].get("reportedCurrency")
+            # An empty leg is reported once, in the missing-symbols warning below.
+            if isinstance(ttm_data, EmptyDataError):
+                ttm_data = []
+            elif isinstance(ttm_data, BaseException):
+                warnings.warn(f"Error fetching TTM data for {symbol}: {ttm_data}")
+                ttm_data = []
 
+            if isinstance(metrics_data, EmptyDataError):
+                metrics_data = []
+            elif isinstance(metrics_data, BaseException):
+                warnings.warn(
+                    f"Error fetching metrics data for {symbol}: {metrics_data}"
+                )
+                metrics_data = []
+
+            currency = metrics_data[0].get("reportedCurrency") if metrics_data else None
+
+            # The TTM row goes first, ahead of the most recent period.
             if ttm_data and query.ttm != "exclude":
-                ttm_result = ttm_data[0]
-                ttm_result["date"] = datetime.today().date().isoformat()
+                # TTM keys only differ from the period keys by their suffix.
+                ttm_result = {k.removesuffix("TTM"): v for k, v in ttm_data[0].items()}
+                ttm_result["date"] = today_iso
                 ttm_result["fiscal_period"] = "TTM"
-                ttm_result["fiscal_year"] = datetime.today().year
+                ttm_result["fiscal_year"] = today.year
                 if currency:
                     ttm_result["reportedCurrency"] = currency
-                result.insert(0, ttm_result)
+                result.append(ttm_result)
 
-            if not result:
-                warnings.warn(f"Symbol Error: No data found for {symbol}.")
+            if metrics_data and query.ttm != "only":
+                result.extend(metrics_data)
 
-            if result:
-                results.extend(result)
+            return result
 
         tasks = [get_one(symbol) for symbol in symbols]
+        per_symbol = await asyncio.gather(*tasks)
+
+        if missing := [s for s, r in zip(symbols, per_symbol) if not r]:
+            warnings.warn(f"Symbol Error: No data found for {', '.join(missing)}.")
 
-        await asyncio.gather(*tasks)
+        results = list(chain.from_iterable(per_symbol))
 
         if not results:
             raise EmptyDataError("No data found for given symbols.")
@@ -309,7 +295,6 @@ class FMPKeyMetricsFetcher(
         **kwargs: Any,
     ) -> list[FMPKeyMetricsData]:
         """Return the transformed data."""
-        return [
-            FMPKeyMetricsData.model_validate(d)
-            for d in sorted(data, key=lambda x: x["date"], reverse=True)
-        ]
+        return _DATA_ADAPTER.validate_python(
+            sort_newest_first(data, itemgetter("date"))
+        )
@@ -5,7 +5,9 @@
 from datetime import (
     date as dateType,
     datetime,
+    timezone,
 )
+from operator import itemgetter
 from typing import Any
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -13,8 +15,20 @@ from openbb_core.provider.standard_models.market_snapshots import (
     MarketSnapshotsData,
     MarketSnapshotsQueryParams,
 )
+from openbb_core.provider.utils.errors import EmptyDataError
+from openbb_core.provider.utils.helpers import safe_fromtimestamp
 from openbb_fmp.utils.definitions import MARKETS
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
+
+# Markets served by a dedicated batch endpoint, rather than exchange-quote.
+_BATCH_ENDPOINTS = {
+    "ETF": "etf-quotes",
+    "MUTUAL_FUND": "mutualfund-quotes",
+    "FOREX": "forex-quotes",
+    "CRYPTO": "crypto-quotes",
+    "INDEX": "index-quotes",
+    "COMMODITY": "commodity-quotes",
+}
 
 
 class FMPMarketSnapshotsQueryParams(MarketSnapshotsQueryParams):
@@ -67,7 +81,9 @@ class FMPMarketSnapshotsData(MarketSnapshotsData):
     @classmethod
     def _normalize_percent(cls, v):
         """Normalize the percent."""
-        return float(v) / 100 if v else 0
+        if not v:
+            return 0
+        return (v if isinstance(v, float) else float(v)) / 100
 
     @field_validator("name", mode="before", check_fields=False)
     @classmethod
@@ -75,6 +91,17 @@ class FMPMarketSnapshotsData(MarketSnapshotsData):
         """Clear empty strings."""
         return v if v and v not in (" ", "''") else None
 
+    @field_validator("last_price_timestamp", mode="before", check_fields=False)
+    @classmethod
+    def _validate_timestamp(cls, v):
+        """Convert the UNIX timestamp to a naive UTC datetime."""
+        if isinstance(v, (int, float)):
+            return safe_fromtimestamp(v, tz=timezone.utc).replace(tzinfo=None)
+        return v or None
+
+
+_DATA_ADAPTER = TypeAdapter(list[FMPMarketSnapshotsData])
+
 
 class FMPMarketSnapshotsFetcher(
     Fetcher[
@@ -102,21 +129,12 @@ class FMPMarketSnapshotsFetcher(
         api_key = credentials.get("fmp_api_key") if credentials else ""
         base_url = "https://financialmodelingprep.com/stable/batch-"
         market = query.market.upper()
-
-        if market == "ETF":
-            url = f"{base_url}etf-quotes?short=false&apikey={api_key}"
-        elif market == "MUTUAL_FUND":
-            url = f"{base_url}mutualfund-quotes?short=false&apikey={api_key}"
-        elif market == "FOREX":
-            url = f"{base_url}forex-quotes?short=false&apikey={api_key}"
-        elif market == "CRYPTO":
-            url = f"{base_url}crypto-quotes?short=false&apikey={api_key}"
-        elif market == "INDEX":
-            url = f"{base_url}index-quotes?short=false&apikey={api_key}"
-        elif market == "COMMODITY":
-            url = f"{base_url}commodity-quotes?short=false&apikey={api_key}"
-        else:
-            url = f"{base_url}exchange-quote?exchange={market}&short=false&apikey={api_key}"
+        endpoint = _BATCH_ENDPOINTS.get(market)
+        url = (
+            f"{base_url}{endpoint}?short=false&apikey={api_key}"
+            if endpoint
+            else f"{base_url}exchange-quote?exchange={market}&short=false&apikey={api_key}"
+        )
 
         return await get_data_many(url, **kwargs)
 
@@ -125,26 +143,15 @@ class FMPMarketSnapshotsFetcher(
         query: FMPMarketSnapshotsQueryParams, data: list, **kwargs: Any
     ) -> list[FMPMarketSnapshotsData]:
         """Return the transformed data."""
-        # pylint: disable=import-outside-toplevel
-        import pandas as pd
-        from openbb_core.provider.utils.errors import EmptyDataError
-
-        df = pd.DataFrame(data)
+        max_ts = max((d.get("timestamp") or 0 for d in data), default=0)
 
-        if df.empty:
+        if not max_ts:
             raise EmptyDataError("No data was returned")
 
         # We need to clean up the response because there is lots of very old data included.
-        # Purge to most recent day only
-        df.timestamp = pd.to_datetime(df.timestamp, unit="s", utc=True).dt.tz_localize(
-            None
-        )
-        max_date = df.timestamp.max().date()
-        df = df[df.timestamp.dt.date == max_date]
-
-        return [
-            FMPMarketSnapshotsData.model_validate(d)
-            for d in df.sort_values(by="timestamp", ascending=False).to_dict(
-                orient="records"
-            )
-        ]
+        # Purge to most recent day (UTC) only
+        day_start = max_ts - max_ts % 86400
+        data = [d for d in data if (d.get("timestamp") or 0) >= day_start]
+        data.sort(key=itemgetter("timestamp"), reverse=True)
+
+        return _DATA_ADAPTER.validate_python(data)
@@ -10,7 +10,7 @@ from openbb_core.provider.standard_models.nport_disclosure import (
     NportDisclosureData,
     NportDisclosureQueryParams,
 )
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
 
 
 class FMPNportDisclosureQueryParams(NportDisclosureQueryParams):
@@ -66,6 +66,9 @@ class FMPNportDisclosureData(NportDisclosureData):
         return v if v else None
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPNportDisclosureData])
+
+
 class FMPNportDisclosureFetcher(
     Fetcher[
         FMPNportDisclosureQueryParams,
@@ -88,7 +91,6 @@ class FMPNportDisclosureFetcher(
         """Return the raw data from the FMP endpoint."""
         # pylint: disable=import-outside-toplevel
         from openbb_fmp.utils.helpers import get_data_many
-        from pandas import Timestamp
 
         api_key = credentials.get("fmp_api_key") if credentials else ""
         url = "https://financialmodelingprep.com/stable/funds/disclosure?"
@@ -98,16 +100,17 @@ class FMPNportDisclosureFetcher(
         else:
             url += f"symbol={query.symbol}"
 
-        now = Timestamp("now")
+        today = dateType.today()
+        current_quarter = (today.month - 1) // 3 + 1
 
         if not query.year:
-            query.year = now.year
+            query.year = today.year
         if not query.quarter:
-            if now.quarter == 1:
+            if current_quarter == 1:
                 query.year -= 1
                 query.quarter = 4
             else:
-                query.quarter = now.quarter - 1
+                query.quarter = current_quarter - 1
 
         url += f"&year={query.year}&quarter={query.quarter}&apikey={api_key}"
 
@@ -120,9 +123,13 @@ class FMPNportDisclosureFetcher(
         **kwargs: Any,
     ) -> list[FMPNportDisclosureData]:
         """Return the transformed data."""
-        results: list[FMPNportDisclosureData] = []
+        rows: list[dict] = []
         for d in data:
-            new_d = {k: v for k, v in d.items() if k not in ("cik", "acceptedDate")}
-            results.append(FMPNportDisclosureData.model_validate(new_d))
+            new_d = d.copy()
+            new_d.pop("cik", None)
+            new_d.pop("acceptedDate", None)
+            rows.append(new_d)
+
+        results = _DATA_ADAPTER.validate_python(rows)
 
         return sorted(results, key=lambda x: (x.weight or 0), reverse=True)
@@ -9,7 +9,7 @@ from openbb_core.provider.standard_models.recent_performance import (
     RecentPerformanceData,
     RecentPerformanceQueryParams,
 )
-from pydantic import model_validator
+from pydantic import TypeAdapter, field_validator
 
 
 class FMPPricePerformanceQueryParams(RecentPerformanceQueryParams):
@@ -20,6 +20,12 @@ class FMPPricePerformanceQueryParams(RecentPerformanceQueryParams):
 
     __json_schema_extra__ = {"symbol": {"multiple_items_allowed": True}}
 
+    @field_validator("symbol", mode="after", check_fields=False)
+    @classmethod
+    def _unique_symbols(cls, v: str) -> str:
+        """Normalize the symbols once, dropping duplicates but keeping their order."""
+        return ",".join(dict.fromkeys(v.upper().split(",")))
+
 
 class FMPPricePerformanceData(RecentPerformanceData):
     """FMP Price Performance Data."""
@@ -36,15 +42,35 @@ class FMPPricePerformanceData(RecentPerformanceData):
         "ten_year": "10Y",
     }
 
-    @model_validator(mode="before")
+    @field_validator(
+        "one_day",
+        "wtd",
+        "one_week",
+        "mtd",
+        "one_month",
+        "qtd",
+        "three_month",
+        "six_month",
+        "ytd",
+        "one_year",
+        "two_year",
+        "three_year",
+        "four_year",
+        "five_year",
+        "ten_year",
+        "max",
+        mode="before",
+        check_fields=False,
+    )
     @classmethod
-    def replace_zero(cls, values):  # pylint: disable=no-self-argument
+    def replace_zero(cls, v):
         """Replace zero with None and convert percents to normalized values."""
-        if isinstance(values, dict):
-            for k, v in values.items():
-                if k != "symbol":
-                    values[k] = None if v == 0 else float(v) / 100
-        return values
+        if not v:
+            return None
+        return (v if isinstance(v, float) else float(v)) / 100
+
+
+_DATA_ADAPTER = TypeAdapter(list[FMPPricePerformanceData])
 
 
 class FMPPricePerformanceFetcher(
@@ -71,7 +97,7 @@ class FMPPricePerformanceFetcher(
         from openbb_fmp.utils.helpers import get_data_urls
 
         api_key = credentials.get("fmp_api_key") if credentials else ""
-        symbols = query.symbol.upper().split(",")
+        symbols = query.symbol.split(",")
         chunk_size = 200
         chunks = [
             symbols[i : i + chunk_size] for i in range(0, len(symbols), chunk_size)
@@ -91,13 +117,12 @@ class FMPPricePerformanceFetcher(
         # pylint: disable=import-outside-toplevel
         import warnings
 
-        symbols = query.symbol.upper().split(",")
-        symbols = list(dict.fromkeys(symbols))
+        symbols = query.symbol.split(",")
         if len(data) != len(symbols):
-            data_symbols = [d["symbol"] for d in data]
+            data_symbols = {d["symbol"] for d in data}
             missing_symbols = [
                 symbol for symbol in symbols if symbol not in data_symbols
             ]
             warnings.warn(f"Missing data for symbols: {missing_symbols}")
 
-        return [FMPPricePerformanceData.model_validate(i) for i in data]
+        return _DATA_ADAPTER.validate_python(data)
@@ -2,7 +2,11 @@
 
 # pylint: disable=unused-argument
 
+import math
+from operator import itemgetter
 from typing import Any
+from urllib.parse import quote
+from warnings import warn
 
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.price_target import (
@@ -10,7 +14,8 @@ from openbb_core.provider.standard_models.price_target import (
     PriceTargetQueryParams,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from pydantic import ConfigDict, Field
+from openbb_fmp.utils.helpers import get_data_urls
+from pydantic import ConfigDict, Field, TypeAdapter
 
 
 class FMPPriceTargetQueryParams(PriceTargetQueryParams):
@@ -43,6 +48,9 @@ class FMPPriceTargetData(PriceTargetData):
     )
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPPriceTargetData])
+
+
 class FMPPriceTargetFetcher(
     Fetcher[
         FMPPriceTargetQueryParams,
@@ -63,45 +71,31 @@ class FMPPriceTargetFetcher(
         **kwargs: Any,
     ) -> list[dict]:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        import asyncio  # noqa
-        import math
-        from warnings import warn
-        from openbb_fmp.utils.helpers import get_data_urls
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
         base_url = "https://financialmodelingprep.com/stable/price-target-news?"
         symbols = query.symbol.split(",")  # type: ignore
         limit = query.limit if query.limit else 100
         pages = math.ceil(limit / 100)
-        results: list[dict] = []
-
-        async def get_one(symbol):
-            """Get data for one symbol."""
-            urls = [
-                f"{base_url}symbol={symbol}&page={page}&limit={limit}&apikey={api_key}"
-                for page in range(pages)
-            ]
-            result = await get_data_urls(urls, **kwargs)
-
-            if not result or len(result) == 0:
-                warn(f"Symbol Error: No data found for {symbol}")
-
-            if result:
-                results.extend(result)
-
-        await asyncio.gather(*[get_one(symbol) for symbol in symbols])
+        # Quote and assemble the fixed parts once, outside the symbol x page loop.
+        prefixes = [f"{base_url}symbol={quote(symbol)}&page=" for symbol in symbols]
+        suffix = f"&limit={limit}&apikey={quote(api_key or '')}"
+        urls = [
+            f"{prefix}{page}{suffix}" for prefix in prefixes for page in range(pages)
+        ]
+        kwargs.setdefault("max_concurrency", 16)
+        results = await get_data_urls(urls, **kwargs)
 
         if not results:
             raise EmptyDataError("No data returned for the given symbols.")
 
-        return sorted(
-            results, key=lambda x: (x["publishedDate"], x["symbol"]), reverse=True
-        )
+        if missing := set(symbols).difference(r.get("symbol") for r in results):  # type: ignore
+            warn(f"Symbol Error: No data found for {', '.join(sorted(missing))}")
+
+        return sorted(results, key=itemgetter("publishedDate", "symbol"), reverse=True)
 
     @staticmethod
     def transform_data(
         query: FMPPriceTargetQueryParams, data: list[dict], **kwargs: Any
     ) -> list[FMPPriceTargetData]:
         """Return the transformed data."""
-        return [FMPPriceTargetData.model_validate(item) for item in data]
+        return _DATA_ADAPTER.validate_python(data)
@@ -2,6 +2,9 @@
 
 # pylint: disable=unused-argument
 
+import asyncio
+import warnings
+from itertools import chain
 from typing import Any
 
 from openbb_core.app.model.abstract.error import OpenBBError
@@ -11,7 +14,8 @@ from openbb_core.provider.standard_models.price_target_consensus import (
     PriceTargetConsensusQueryParams,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from pydantic import field_validator
+from openbb_fmp.utils.helpers import get_data_urls
+from pydantic import TypeAdapter, field_validator
 
 
 class FMPPriceTargetConsensusQueryParams(PriceTargetConsensusQueryParams):
@@ -35,6 +39,9 @@ class FMPPriceTargetConsensusData(PriceTargetConsensusData):
     """FMP Price Target Consensus Data."""
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPPriceTargetConsensusData])
+
+
 class FMPPriceTargetConsensusFetcher(
     Fetcher[
         FMPPriceTargetConsensusQueryParams,
@@ -55,35 +62,36 @@ class FMPPriceTargetConsensusFetcher(
         **kwargs: Any,
     ) -> list[dict]:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        import asyncio  # noqa
-        import warnings
-        from openbb_fmp.utils.helpers import get_data_urls
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
 
         symbols = query.symbol.split(",")  # type: ignore
-        results: list[dict] = []
+        semaphore = asyncio.Semaphore(16)
 
-        async def get_one(symbol):
+        async def get_one(symbol) -> list[dict]:
             """Get data for one symbol."""
             url = f"https://financialmodelingprep.com/stable/price-target-consensus?symbol={symbol}&apikey={api_key}"
-            result = await get_data_urls([url], **kwargs)
+            async with semaphore:
+                result = await get_data_urls([url], **kwargs)
 
-            if not result or len(result) == 0:
+            if not result:
                 warnings.warn(f"Symbol Error: No data found for {symbol}")
 
-            if result:
-                results.extend(result)
+            return result or []  # type: ignore
 
-        await asyncio.gather(*[get_one(symbol) for symbol in symbols])
+        results = list(
+            chain.from_iterable(
+                await asyncio.gather(*[get_one(symbol) for symbol in symbols])
+            )
+        )
 
         if not results:
             raise EmptyDataError("No data returned for the given symbols.")
 
+        order = {symbol: i for i, symbol in enumerate(symbols)}
+
         return sorted(
             results,
-            key=(lambda item: (symbols.index(item.get("symbol", len(symbols))))),
+            key=lambda item: order.get(item.get("symbol"), len(symbols)),
         )
 
     @staticmethod
@@ -93,4 +101,4 @@ class FMPPriceTargetConsensusFetcher(
         **kwargs: Any,
     ) -> list[FMPPriceTargetConsensusData]:
         """Return the transformed data."""
-        return [FMPPriceTargetConsensusData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
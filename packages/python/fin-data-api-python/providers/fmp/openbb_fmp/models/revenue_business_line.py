@@ -11,7 +11,7 @@ from openbb_core.provider.standard_models.revenue_business_line import (
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.errors import EmptyDataError
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 
 class FMPRevenueBusinessLineQueryParams(RevenueBusinessLineQueryParams):
@@ -29,6 +29,9 @@ class FMPRevenueBusinessLineData(RevenueBusinessLineData):
     """FMP Revenue By Business Line Data."""
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPRevenueBusinessLineData])
+
+
 class FMPRevenueBusinessLineFetcher(
     Fetcher[
         FMPRevenueBusinessLineQueryParams,
@@ -69,7 +72,7 @@ class FMPRevenueBusinessLineFetcher(
         if not data:
             raise EmptyDataError("The request was returned empty.")
 
-        results: list = []
+        flat: list[dict] = []
         # We need to flatten the data.
         for item in data:
             period_ending = item.get("date")
@@ -78,22 +81,25 @@ class FMPRevenueBusinessLineFetcher(
             segment = item.get("data", {})
 
             for business_line, revenue_value in segment.items():
-                if revenue_value is not None:
-                    revenue = int(revenue_value) if revenue_value is not None else None
-                    if revenue is not None:
-                        results.append(
-                            FMPRevenueBusinessLineData.model_validate(
-                                {
-                                    "period_ending": period_ending,
-                                    "fiscal_year": fiscal_year,
-                                    "fiscal_period": fiscal_period,
-                                    "business_line": business_line.strip(),
-                                    "revenue": revenue,
-                                }
-                            )
-                        )
-
-        if not results:
+                if revenue_value is None:
+                    continue
+                flat.append(
+                    {
+                        "period_ending": period_ending,
+                        "fiscal_year": fiscal_year,
+                        "fiscal_period": fiscal_period,
+                        "business_line": business_line.strip(),
+                        "revenue": (
+                            revenue_value
+                            if isinstance(revenue_value, int)
+                            else int(revenue_value)
+                        ),
+                    }
+                )
+
+        if not flat:
             raise EmptyDataError("Unknown error while transforming the data.")
 
+        results = _DATA_ADAPTER.validate_python(flat)
+
         return sorted(results, key=lambda x: (x.period_ending or "", x.revenue or 0))
@@ -12,7 +12,7 @@ from openbb_core.provider.standard_models.revenue_geographic import (
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.errors import EmptyDataError
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
 
 
 class FMPRevenueGeographicQueryParams(RevenueGeographicQueryParams):
@@ -33,7 +33,10 @@ class FMPRevenueGeographicData(RevenueGeographicData):
     @classmethod
     def date_validate(cls, v):
         """Return the date as a datetime object."""
-        return datetime.strptime(v, "%Y-%m-%d") if v else None
+        return datetime.fromisoformat(v) if v else None
+
+
+_DATA_ADAPTER = TypeAdapter(list[FMPRevenueGeographicData])
 
 
 class FMPRevenueGeographicFetcher(
@@ -76,7 +79,7 @@ class FMPRevenueGeographicFetcher(
         if not data:
             raise EmptyDataError("The request was returned empty.")
 
-        results: list[FMPRevenueGeographicData] = []
+        flat: list[dict] = []
         # We need to flatten the data.
         for item in data:
             period_ending = item.get("date")
@@ -85,22 +88,25 @@ class FMPRevenueGeographicFetcher(
             segment = item.get("data", {})
 
             for region, revenue_value in segment.items():
-                if revenue_value is not None:
-                    revenue = int(revenue_value) if revenue_value is not None else None
-                    if revenue is not None:
-                        results.append(
-                            FMPRevenueGeographicData.model_validate(
-                                {
-                                    "period_ending": period_ending,
-                                    "fiscal_year": fiscal_year,
-                                    "fiscal_period": fiscal_period,
-                                    "region": region.replace("Segment", "").strip(),
-                                    "revenue": revenue,
-                                }
-                            )
-                        )
-
-        if not results:
+                if revenue_value is None:
+                    continue
+                flat.append(
+                    {
+                        "period_ending": period_ending,
+                        "fiscal_year": fiscal_year,
+                        "fiscal_period": fiscal_period,
+                        "region": region.replace("Segment", "").strip(),
+                        "revenue": (
+                            revenue_value
+                            if isinstance(revenue_value, int)
+                            else int(revenue_value)
+                        ),
+                    }
+                )
+
+        if not flat:
             raise EmptyDataError("Unknown error while transforming the data.")
 
+        results = _DATA_ADAPTER.validate_python(flat)
+
         return sorted(results, key=lambda x: (x.period_ending or "", x.revenue or 0))
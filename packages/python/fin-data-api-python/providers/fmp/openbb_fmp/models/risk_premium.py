@@ -9,6 +9,7 @@ from openbb_core.provider.standard_models.risk_premium import (
     RiskPremiumData,
     RiskPremiumQueryParams,
 )
+from pydantic import TypeAdapter
 
 
 class FMPRiskPremiumQueryParams(RiskPremiumQueryParams):
@@ -22,6 +23,9 @@ class FMPRiskPremiumData(RiskPremiumData):
     """FMP Risk Premium Data."""
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPRiskPremiumData])
+
+
 class FMPRiskPremiumFetcher(
     Fetcher[
         FMPRiskPremiumQueryParams,
@@ -55,4 +59,4 @@ class FMPRiskPremiumFetcher(
         query: FMPRiskPremiumQueryParams, data: list[dict], **kwargs: Any
     ) -> list[FMPRiskPremiumData]:
         """Return the transformed data."""
-        return [FMPRiskPremiumData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
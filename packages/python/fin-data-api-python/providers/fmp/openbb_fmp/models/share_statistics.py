@@ -2,6 +2,7 @@
 
 # pylint: disable=unused-argument
 
+import warnings
 from typing import Any
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -9,7 +10,8 @@ from openbb_core.provider.standard_models.share_statistics import (
     ShareStatisticsData,
     ShareStatisticsQueryParams,
 )
-from pydantic import Field, field_validator
+from openbb_fmp.utils.helpers import get_data_urls
+from pydantic import Field, TypeAdapter, field_validator
 
 
 class FMPShareStatisticsQueryParams(ShareStatisticsQueryParams):
@@ -38,6 +40,9 @@ class FMPShareStatisticsData(ShareStatisticsData):
         return v / 100 if v else None
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPShareStatisticsData])
+
+
 class FMPShareStatisticsFetcher(
     Fetcher[
         FMPShareStatisticsQueryParams,
@@ -58,9 +63,6 @@ class FMPShareStatisticsFetcher(
         **kwargs: Any,
     ) -> list:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        from openbb_fmp.utils.helpers import get_data_urls
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
         symbols = query.symbol.split(",")
 
@@ -76,23 +78,18 @@ class FMPShareStatisticsFetcher(
         query: FMPShareStatisticsQueryParams, data: list, **kwargs: Any
     ) -> list[FMPShareStatisticsData]:
         """Return the transformed data."""
-        # pylint: disable=import-outside-toplevel
-        import warnings
-
         symbols = query.symbol.split(",")
+        order = {symbol: i for i, symbol in enumerate(symbols)}
+        n_symbols = len(symbols)
 
-        if len(symbols) != len(data):
-            data_symbols = {d["symbol"] for d in data if "symbol" in d}
-            missing_symbols = set(symbols) - data_symbols
+        if n_symbols != len(data):
+            seen = {d.get("symbol") for d in data}
+            missing_symbols = [s for s in symbols if s not in seen]
             if missing_symbols:
                 warnings.warn(
                     f"No data found for symbols: {', '.join(missing_symbols)}"
                 )
 
-        return [
-            FMPShareStatisticsData.model_validate(d)
-            for d in sorted(
-                data,
-                key=(lambda item: (symbols.index(item.get("symbol", len(symbols))))),
-            )
-        ]
+        return _DATA_ADAPTER.validate_python(
+            sorted(data, key=lambda item: order.get(item.get("symbol"), n_symbols))
+        )
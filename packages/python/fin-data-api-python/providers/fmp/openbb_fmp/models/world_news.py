@@ -3,6 +3,8 @@
 # pylint: disable=unused-argument
 
 import warnings
+from datetime import datetime
+from operator import itemgetter
 from typing import Any, Literal
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -11,7 +13,8 @@ from openbb_core.provider.standard_models.world_news import (
     WorldNewsQueryParams,
 )
 from openbb_core.provider.utils.errors import EmptyDataError
-from pydantic import Field
+from openbb_fmp.utils.helpers import get_data_many, sort_newest_first
+from pydantic import Field, TypeAdapter
 
 
 class FMPWorldNewsQueryParams(WorldNewsQueryParams):
@@ -50,6 +53,9 @@ class FMPWorldNewsData(WorldNewsData):
     source: str = Field(description="News source.")
 
 
+_DATA_ADAPTER = TypeAdapter(list[FMPWorldNewsData])
+
+
 class FMPWorldNewsFetcher(
     Fetcher[
         FMPWorldNewsQueryParams,
@@ -74,9 +80,6 @@ class FMPWorldNewsFetcher(
         **kwargs: Any,
     ) -> list[dict]:
         """Return the raw data from the FMP endpoint."""
-        # pylint: disable=import-outside-toplevel
-        from openbb_fmp.utils.helpers import get_data_many
-
         api_key = credentials.get("fmp_api_key") if credentials else ""
         base_url = "https://financialmodelingprep.com/stable/"
 
@@ -96,7 +99,11 @@ class FMPWorldNewsFetcher(
 
         results: list = await get_data_many(url, **kwargs)
 
-        return sorted(results, key=lambda x: x["publishedDate"], reverse=True)
+        # Parse once so the sort compares datetimes and validation receives them as-is.
+        for result in results:
+            result["publishedDate"] = datetime.fromisoformat(result["publishedDate"])
+
+        return sort_newest_first(results, itemgetter("publishedDate"))
 
     @staticmethod
     def transform_data(
@@ -105,4 +112,4 @@ class FMPWorldNewsFetcher(
         """Return the transformed data."""
         if not data:
             raise EmptyDataError("No data was returned from FMP query.")
-        return [FMPWorldNewsData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
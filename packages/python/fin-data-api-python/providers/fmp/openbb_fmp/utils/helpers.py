@@ -1,12 +1,51 @@
 """FMP Helpers Module."""
 
+import asyncio
+import re
+import time
+from collections.abc import Callable
 from datetime import date
-from functools import lru_cache
-from typing import Any
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+from warnings import warn
 
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.utils.errors import EmptyDataError, UnauthorizedError
 from openbb_core.provider.utils.helpers import get_querystring
+from pydantic_core import from_json
+
+if TYPE_CHECKING:
+    from aiohttp_client_cache import SQLiteBackend
+
+_UNAUTHORIZED_PATTERN = re.compile(
+    "upgrade|exclusive endpoint|special endpoint|premium query parameter"
+    "|subscription|unauthorized|premium",
+    re.IGNORECASE,
+)
+
+# (month, day) of each calendar quarter end.
+_QUARTER_ENDS = ((3, 31), (6, 30), (9, 30), (12, 31))
+
+# Historical price endpoints, by adjustment first and then by interval.
+_OHLC_ADJUSTMENT_ENDPOINTS = {
+    "unadjusted": "historical-price-eod/non-split-adjusted?",
+    "splits_and_dividends": "historical-price-eod/dividend-adjusted?",
+}
+_OHLC_INTERVAL_ENDPOINTS = {
+    "1d": "historical-price-eod/full?",
+    "1m": "historical-chart/1min?",
+    "5m": "historical-chart/5min?",
+    "60m": "historical-chart/1hour?",
+}
+
+# Upper bound on in-flight requests when fetching several FMP urls at once.
+_MAX_CONCURRENCY = 20
+
+# Transcript listings change at most a few times a day.
+_TRANSCRIPT_CACHE_TTL = 3600
+_TRANSCRIPT_CACHE_SIZE = 64
+_TRANSCRIPT_CACHE: dict[tuple[str, ...], tuple[float, list]] = {}
+_TRANSCRIPT_LOCKS: dict[tuple[str, ...], asyncio.Lock] = {}
 
 
 async def response_callback(response, _):
@@ -16,23 +55,16 @@ async def response_callback(response, _):
         code = response.status
         raise UnauthorizedError(f"Unauthorized FMP request -> {code} -> {msg}")
 
-    data = await response.json()
+    # Parse the raw bytes with pydantic's jiter parser, the same one behind
+    # model_validate_json, instead of decoding to text for the stdlib json module.
+    body = await response.read()
+    data = from_json(body) if body.strip() else None
 
     if isinstance(data, dict):
         error_message = data.get("Error Message", data.get("error"))
 
         if error_message is not None:
-            conditions = (
-                "upgrade" in error_message.lower()
-                or "exclusive endpoint" in error_message.lower()
-                or "special endpoint" in error_message.lower()
-                or "premium query parameter" in error_message.lower()
-                or "subscription" in error_message.lower()
-                or "unauthorized" in error_message.lower()
-                or "premium" in error_message.lower()
-            )
-
-            if conditions:
+            if _UNAUTHORIZED_PATTERN.search(error_message):
                 raise UnauthorizedError(f"Unauthorized FMP request -> {error_message}")
 
             raise OpenBBError(
@@ -42,20 +74,100 @@ async def response_callback(response, _):
     return data
 
 
-async def get_data(url: str, **kwargs: Any) -> list | dict:
-    """Get data from FMP endpoint."""
+def get_cache_backend(expire_after: int = 3600) -> "SQLiteBackend":
+    """Get the SQLiteBackend for cached FMP responses.
+
+    The API key is left out of the cache key, so entries survive a key rotation.
+    """
+    # pylint: disable=import-outside-toplevel
+    from aiohttp_client_cache import SQLiteBackend
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return SQLiteBackend(
+        f"{get_user_cache_directory()}/http/fmp",
+        expire_after=expire_after,
+        ignored_params=["apikey"],
+    )
+
+
+async def get_data(
+    url: str, use_cache: bool = False, expire_after: int = 3600, **kwargs: Any
+) -> list | dict:
+    """Get data from FMP endpoint.
+
+    If use_cache is True, responses are cached on disk for expire_after seconds.
+    """
     # pylint: disable=import-outside-toplevel
     from openbb_core.provider.utils.helpers import amake_request
 
+    if use_cache is True:
+        from aiohttp_client_cache.session import CachedSession
+
+        kwargs["session"] = CachedSession(cache=get_cache_backend(expire_after))
+        kwargs["with_session"] = False
+
     return await amake_request(url, response_callback=response_callback, **kwargs)
 
 
-async def get_data_urls(urls: list[str], **kwargs: Any) -> list | dict:
-    """Get data from FMP for several urls."""
+async def get_data_urls(
+    urls: list[str], use_cache: bool = False, expire_after: int = 3600, **kwargs: Any
+) -> list:
+    """Get data from FMP for several urls.
+
+    The urls are requested concurrently over one session, with at most
+    max_concurrency (default 20) requests in flight at a time.
+    List responses are combined into one list and empty responses are skipped.
+    An UnauthorizedError is raised right away; other errors are raised only
+    when no url returned data.
+    A session passed in by the caller is used and left open.
+    If use_cache is True, responses are cached on disk for expire_after seconds.
+    """
     # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import amake_requests
+    from openbb_core.provider.utils.helpers import (
+        amake_request,
+        get_async_requests_session,
+    )
+
+    semaphore = asyncio.Semaphore(kwargs.pop("max_concurrency", _MAX_CONCURRENCY))
+
+    if use_cache is True:
+        from aiohttp_client_cache.session import CachedSession
+
+        kwargs["session"] = CachedSession(cache=get_cache_backend(expire_after))
+
+    owns_session = use_cache is True or "session" not in kwargs
+    session = kwargs.pop("session", None) or await get_async_requests_session(**kwargs)
 
-    return await amake_requests(urls, response_callback=response_callback, **kwargs)
+    async def get_one(url: str):
+        """Request one url once a slot is free."""
+        async with semaphore:
+            return await amake_request(
+                url, response_callback=response_callback, session=session, **kwargs
+            )
+
+    try:
+        responses = await asyncio.gather(
+            *[get_one(url) for url in urls], return_exceptions=True
+        )
+    finally:
+        if owns_session:
+            await session.close()
+
+    results: list = []
+    errors: list = []
+
+    for response in responses:
+        if isinstance(response, UnauthorizedError):
+            raise response
+        if isinstance(response, Exception):
+            errors.append(response)
+        elif response:
+            results.extend(response if isinstance(response, list) else [response])
+
+    if errors and not results:
+        raise errors[0]
+
+    return results
 
 
 def create_url(
@@ -140,22 +252,29 @@ async def get_data_one(url: str, **kwargs: Any) -> dict:
     return data
 
 
+def sort_newest_first(data: list[dict], key: Callable[[dict], Any]) -> list[dict]:
+    """Sort records in descending order of key, in place.
+
+    FMP usually returns records newest-first already,
+    so the sort is skipped when the keys are already in descending order.
+    """
+    keys = list(map(key, data))
+    if any(a < b for a, b in zip(keys, keys[1:])):
+        data.sort(key=key, reverse=True)
+    return data
+
+
 def most_recent_quarter(base: date | None = None) -> date:
     """Get the most recent quarter date."""
     if base is None:
         base = date.today()
     base = min(base, date.today())  # This prevents dates from being in the future
-    exacts = [(3, 31), (6, 30), (9, 30), (12, 31)]
-    for exact in exacts:
-        if base.month == exact[0] and base.day == exact[1]:
-            return base
-    if base.month < 4:
-        return date(base.year - 1, 12, 31)
-    if base.month < 7:
-        return date(base.year, 3, 31)
-    if base.month < 10:
-        return date(base.year, 6, 30)
-    return date(base.year, 9, 30)
+    quarter = (base.month - 1) // 3
+    if (base.month, base.day) == _QUARTER_ENDS[quarter]:
+        return base
+    # Index -1 wraps the first quarter around to December 31 of the prior year.
+    month, day = _QUARTER_ENDS[quarter - 1]
+    return date(base.year - (quarter == 0), month, day)
 
 
 def get_interval(value: str) -> str:
@@ -172,44 +291,37 @@ def get_interval(value: str) -> str:
 async def get_historical_ohlc(query, credentials, **kwargs: Any) -> list[dict]:
     """Return the raw data from the FMP endpoint."""
     # pylint: disable=import-outside-toplevel
-    import asyncio  # noqa
     from openbb_core.provider.utils.helpers import (
         amake_request,
+        get_async_requests_session,
     )
-    from warnings import warn
 
     api_key = credentials.get("fmp_api_key") if credentials else ""
 
-    base_url = "https://financialmodelingprep.com/stable/"
-
-    if hasattr(query, "adjustment") and query.adjustment == "unadjusted":
-        base_url += "historical-price-eod/non-split-adjusted?"
-    elif hasattr(query, "adjustment") and query.adjustment == "splits_and_dividends":
-        base_url += "historical-price-eod/dividend-adjusted?"
-    elif query.interval == "1d":
-        base_url += "historical-price-eod/full?"
-    elif query.interval == "1m":
-        base_url += "historical-chart/1min?"
-    elif query.interval == "5m":
-        base_url += "historical-chart/5min?"
-    elif query.interval in ["60m", "1h"]:
-        query.interval = "60m"
-        base_url += "historical-chart/1hour?"
+    adjustment = getattr(query, "adjustment", None)
+
+    if adjustment in _OHLC_ADJUSTMENT_ENDPOINTS:
+        endpoint = _OHLC_ADJUSTMENT_ENDPOINTS[adjustment]
+    else:
+        if query.interval == "1h":
+            query.interval = "60m"
+        endpoint = _OHLC_INTERVAL_ENDPOINTS.get(query.interval, "")
+
+    base_url = f"https://financialmodelingprep.com/stable/{endpoint}"
 
     query_str = get_querystring(
         query.model_dump(), ["symbol", "adjustment", "interval"]
     )
     symbols = query.symbol.split(",")
 
-    results: list = []
     messages: list = []
 
-    async def get_one(symbol):
+    async def get_one(symbol) -> list:
         """Get data for one symbol."""
         url = f"{base_url}symbol={symbol}&{query_str}&apikey={api_key}"
         data: list = []
         response = await amake_request(
-            url, response_callback=response_callback, **kwargs
+            url, response_callback=response_callback, session=session, **kwargs
         )
 
         if isinstance(response, dict) and response.get("Error Message"):
@@ -230,46 +342,79 @@ async def get_historical_ohlc(query, credentials, **kwargs: Any) -> list[dict]:
             warn(message)
             messages.append(message)
 
-        elif data:
-            for d in data:
-                d["symbol"] = symbol
-                results.append(d)
+        for d in data:
+            d["symbol"] = symbol
 
-    await asyncio.gather(*[get_one(symbol) for symbol in symbols])
+        return data
 
-    if not results:
-        raise EmptyDataError(
-            f"{str(','.join(messages)).replace(',', ' ') if messages else 'No data found'}"
+    # One session for every symbol, so connections are reused across requests.
+    # A session passed in by the caller is used as-is and left open.
+    owns_session = "session" not in kwargs
+    session = (
+        await get_async_requests_session(**kwargs)
+        if owns_session
+        else kwargs.pop("session")
+    )
+
+    try:
+        results = list(
+            chain.from_iterable(
+                await asyncio.gather(*[get_one(symbol) for symbol in symbols])
+            )
         )
+    finally:
+        if owns_session:
+            await session.close()
+
+    if not results:
+        raise EmptyDataError(" ".join(messages) if messages else "No data found")
 
     return results
 
 
-@lru_cache(maxsize=1)
-def get_available_transcript_symbols(api_key) -> list:
-    """Return the available symbols for earnings call transcripts."""
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
+async def _get_cached_transcript_list(key: tuple[str, ...], url: str) -> list:
+    """Return a transcript listing, fetching it at most once per key and TTL.
 
-    url = f"https://financialmodelingprep.com/stable/earnings-transcript-list?apikey={api_key}"
+    Concurrent callers for the same key wait on one in-flight request.
+    """
+    async with _TRANSCRIPT_LOCKS.setdefault(key, asyncio.Lock()):
+        cached = _TRANSCRIPT_CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < _TRANSCRIPT_CACHE_TTL:
+            return cached[1]
+
+        data = await get_data(url)
+
+        if (
+            key not in _TRANSCRIPT_CACHE
+            and len(_TRANSCRIPT_CACHE) >= _TRANSCRIPT_CACHE_SIZE
+        ):
+            # Skip entries whose lock is held, so their waiters keep sharing one request.
+            oldest = next(
+                (
+                    cached_key
+                    for cached_key in _TRANSCRIPT_CACHE
+                    if (lock := _TRANSCRIPT_LOCKS.get(cached_key)) is None
+                    or not lock.locked()
+                ),
+                None,
+            )
+            if oldest is not None:
+                _TRANSCRIPT_CACHE.pop(oldest)
+                _TRANSCRIPT_LOCKS.pop(oldest, None)
+        _TRANSCRIPT_CACHE[key] = (time.monotonic(), data)  # type: ignore
 
-    data = make_request(url)
+        return data  # type: ignore
 
-    data.raise_for_status()
 
-    return data.json()
+async def get_available_transcript_symbols(api_key) -> list:
+    """Return the available symbols for earnings call transcripts."""
+    url = f"https://financialmodelingprep.com/stable/earnings-transcript-list?apikey={api_key}"
 
+    return await _get_cached_transcript_list(("symbols", api_key), url)
 
-@lru_cache(maxsize=64)
-def get_transcript_dates_for_symbol(symbol: str, api_key: str) -> list:
-    """Return the available dates for a given symbol's earnings call transcripts."""
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
 
+async def get_transcript_dates_for_symbol(symbol: str, api_key: str) -> list:
+    """Return the available dates for a given symbol's earnings call transcripts."""
     url = f"https://financialmodelingprep.com/stable/earning-call-transcript-dates?symbol={symbol}&apikey={api_key}"
 
-    data = make_request(url)
-
-    data.raise_for_status()
-
-    return data.json()
+    return await _get_cached_transcript_list(("dates", symbol, api_key), url)
@@ -0,0 +1 @@
+"""FMP tests."""
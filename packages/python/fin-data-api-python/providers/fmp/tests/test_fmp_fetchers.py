@@ -0,0 +1,64 @@
+"""Test FMP fetchers."""
+
+import asyncio
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from aiohttp import web
+from openbb_fmp.models.insider_trading import FMPInsiderTradingFetcher
+from openbb_fmp.utils.helpers import get_data_urls
+
+
+@pytest.mark.asyncio
+async def test_fmp_insider_trading_pagination():
+    """Test that insider trading limits above 1000 are split into pages and trimmed."""
+    requested: list[str] = []
+
+    async def mock_get_data_urls(urls, **kwargs):
+        requested.extend(urls)
+        return [{"filingDate": "2024-01-02"} for _ in urls for _ in range(1000)]
+
+    fetcher = FMPInsiderTradingFetcher()
+    query = fetcher.transform_query({"symbol": "AAPL", "limit": 1500})
+    with mock.patch(
+        "openbb_fmp.models.insider_trading.get_data_urls", mock_get_data_urls
+    ):
+        data = await fetcher.aextract_data(query, {"fmp_api_key": "MOCK"})
+
+    pages = [parse_qs(urlparse(url).query) for url in requested]
+    assert [page["page"] for page in pages] == [["0"], ["1"]]
+    assert all(page["limit"] == ["1000"] for page in pages)
+    assert all(page["symbol"] == ["AAPL"] for page in pages)
+    assert len(data) == 1500
+
+
+@pytest.mark.asyncio
+async def test_fmp_get_data_urls_concurrency():
+    """Test that get_data_urls caps in-flight requests and combines the results."""
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.02)
+        in_flight["now"] -= 1
+        page = request.query["page"]
+        return web.json_response([] if page == "0" else [{"page": page}])
+
+    app = web.Application()
+    app.router.add_get("/data", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    try:
+        urls = [f"http://127.0.0.1:{port}/data?page={page}" for page in range(10)]
+        data = await get_data_urls(urls, max_concurrency=3)
+    finally:
+        await runner.cleanup()
+
+    assert in_flight["max"] == 3
+    assert sorted(int(d["page"]) for d in data) == list(range(1, 10))
@@ -13,7 +13,7 @@ from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import get_querystring
 from openbb_intrinio.utils.helpers import get_data_one
 from openbb_intrinio.utils.references import IntrinioCompany, IntrinioSecurity
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 
 class IntrinioCalendarIpoQueryParams(CalendarIpoQueryParams):
@@ -155,6 +155,9 @@ class IntrinioCalendarIpoData(CalendarIpoData):
     )
 
 
+_DATA_ADAPTER = TypeAdapter(list[IntrinioCalendarIpoData])
+
+
 class IntrinioCalendarIpoFetcher(
     Fetcher[IntrinioCalendarIpoQueryParams, list[IntrinioCalendarIpoData]]
 ):
@@ -189,4 +192,4 @@ class IntrinioCalendarIpoFetcher(
         """Return the transformed data."""
         if not data:
             raise EmptyDataError("The request was returned empty.")
-        return [IntrinioCalendarIpoData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
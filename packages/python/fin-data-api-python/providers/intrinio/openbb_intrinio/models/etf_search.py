@@ -12,7 +12,7 @@ from openbb_core.provider.standard_models.etf_search import (
 )
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_intrinio.utils.references import ETF_EXCHANGES
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 
 class IntrinioEtfSearchQueryParams(EtfSearchQueryParams):
@@ -63,6 +63,9 @@ class IntrinioEtfSearchData(EtfSearchData):
     )
 
 
+_DATA_ADAPTER = TypeAdapter(list[IntrinioEtfSearchData])
+
+
 class IntrinioEtfSearchFetcher(
     Fetcher[IntrinioEtfSearchQueryParams, list[IntrinioEtfSearchData]]
 ):
@@ -127,19 +130,12 @@ class IntrinioEtfSearchFetcher(
         """Transform data."""
         # pylint: disable=import-outside-toplevel
         import re  # noqa
-        from pandas import DataFrame  # noqa
 
         if not data:
             raise EmptyDataError("No data found.")
 
-        results = DataFrame(data)
         if query.query:
-            pattern = f".*{re.escape(query.query)}.*"
-            results = results[
-                results["name"].str.contains(pattern, case=False, regex=True)
-            ]
-
-        return [
-            IntrinioEtfSearchData.model_validate(d)
-            for d in results.to_dict(orient="records")
-        ]
+            pattern = re.compile(re.escape(query.query), re.IGNORECASE)
+            data = [d for d in data if pattern.search(d.get("name") or "")]
+
+        return _DATA_ADAPTER.validate_python(data)
@@ -2,7 +2,6 @@
 
 # pylint: disable=unused-argument
 
-import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -18,7 +17,15 @@ from openbb_core.provider.utils.helpers import (
     amake_requests,
     get_querystring,
 )
-from pydantic import Field
+from openbb_intrinio.utils.helpers import (
+    RateLimiter,
+    get_cache_expiry,
+    get_cached_session,
+)
+from pydantic import Field, TypeAdapter
+from pydantic_core import from_json
+
+_ONE_YEAR = relativedelta(years=1)
 
 
 class IntrinioFredSeriesQueryParams(SeriesQueryParams):
@@ -45,6 +52,9 @@ class IntrinioFredSeriesData(SeriesData):
     value: float | None = Field(default=None, description="Value of the index.")
 
 
+_DATA_ADAPTER = TypeAdapter(list[IntrinioFredSeriesData])
+
+
 class IntrinioFredSeriesFetcher(
     Fetcher[
         IntrinioFredSeriesQueryParams,
@@ -58,12 +68,12 @@ class IntrinioFredSeriesFetcher(
         """Transform the query params."""
         transformed_params = params
 
-        now = datetime.now().date()
-        if params.get("start_date") is None:
-            transformed_params["start_date"] = now - relativedelta(years=1)
-
-        if params.get("end_date") is None:
-            transformed_params["end_date"] = now
+        if params.get("start_date") is None or params.get("end_date") is None:
+            now = datetime.now().date()
+            if params.get("start_date") is None:
+                transformed_params["start_date"] = now - _ONE_YEAR
+            if params.get("end_date") is None:
+                transformed_params["end_date"] = now
 
         return IntrinioFredSeriesQueryParams(**transformed_params)
 
@@ -88,27 +98,32 @@ class IntrinioFredSeriesFetcher(
 
         async def callback(response: ClientResponse, session: ClientSession) -> list:
             """Return the response."""
-            init_response: Any = await response.json()
-            all_data: list = []
-            init_data = init_response.get("historical_data", [])
-
-            if init_data and isinstance(init_data, list):
-                all_data.extend(init_data)
+            init_response: Any = from_json(await response.read())
+            all_data: list = init_response.get("historical_data") or []
 
             if query.all_pages:
+                limiter = (
+                    RateLimiter(query.sleep or 1.0)
+                    if query.limit and query.limit > 100
+                    else None
+                )
                 next_page = init_response.get("next_page", None)
                 while next_page:
-                    if query.limit and query.limit > 100:
-                        await asyncio.sleep(query.sleep or 1.0)
+                    if limiter is not None:
+                        await limiter.wait()
 
                     url = response.url.update_query(next_page=next_page).human_repr()
-                    response_data = await session.get_json(url)
+                    page = await session.get(url)
+                    response_data = from_json(await page.read())
 
-                    all_data.extend(response_data.get("historical_data", []))  # type: ignore
+                    all_data += response_data.get("historical_data") or []  # type: ignore
                     next_page = response_data.get("next_page", None)  # type: ignore
 
             return all_data
 
+        if kwargs.pop("use_cache", False) is True:
+            kwargs["session"] = get_cached_session(get_cache_expiry(query.end_date))
+
         return await amake_requests([url], callback, **kwargs)
 
     @staticmethod
@@ -116,4 +131,4 @@ class IntrinioFredSeriesFetcher(
         query: IntrinioFredSeriesQueryParams, data: list[dict], **kwargs: Any
     ) -> list[IntrinioFredSeriesData]:
         """Return the transformed data."""
-        return [IntrinioFredSeriesData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
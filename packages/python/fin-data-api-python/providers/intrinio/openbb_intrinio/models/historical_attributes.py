@@ -2,6 +2,7 @@
 
 # pylint: disable = unused-argument
 
+import asyncio
 import warnings
 from datetime import datetime
 from typing import Any
@@ -13,12 +14,20 @@ from openbb_core.provider.standard_models.historical_attributes import (
     HistoricalAttributesData,
     HistoricalAttributesQueryParams,
 )
+from openbb_core.provider.utils.errors import UnauthorizedError
 from openbb_core.provider.utils.helpers import (
     ClientResponse,
     ClientSession,
-    amake_requests,
+    amake_request,
+    get_async_requests_session,
     get_querystring,
 )
+from openbb_intrinio.utils.helpers import get_cache_expiry, get_cached_session
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+
+_FIVE_YEARS = relativedelta(years=5)
+_MAX_CONCURRENCY = 20
 
 
 class IntrinioHistoricalAttributesQueryParams(HistoricalAttributesQueryParams):
@@ -38,6 +47,9 @@ class IntrinioHistoricalAttributesData(HistoricalAttributesData):
     """Intrinio Historical Attributes Data."""
 
 
+_DATA_ADAPTER = TypeAdapter(list[IntrinioHistoricalAttributesData])
+
+
 class IntrinioHistoricalAttributesFetcher(
     Fetcher[
         IntrinioHistoricalAttributesQueryParams,
@@ -53,12 +65,12 @@ class IntrinioHistoricalAttributesFetcher(
         """Transform the query params."""
         transformed_params = params
 
-        now = datetime.now().date()
-        if params.get("start_date") is None:
-            transformed_params["start_date"] = now - relativedelta(years=5)
-
-        if params.get("end_date") is None:
-            transformed_params["end_date"] = now
+        if params.get("start_date") is None or params.get("end_date") is None:
+            now = datetime.now().date()
+            if params.get("start_date") is None:
+                transformed_params["start_date"] = now - _FIVE_YEARS
+            if params.get("end_date") is None:
+                transformed_params["end_date"] = now
 
         return IntrinioHistoricalAttributesQueryParams(**transformed_params)
 
@@ -74,17 +86,11 @@ class IntrinioHistoricalAttributesFetcher(
         base_url = "https://api-v2.intrinio.com"
         query_str = get_querystring(query.model_dump(by_alias=True), ["symbol", "tag"])
 
-        def generate_url(symbol: str, tag: str) -> str:
-            """Return the url for the given symbol and tag."""
-            url_params = f"{symbol}/{tag}?{query_str}&api_key={api_key}"
-            url = f"{base_url}/historical_data/{url_params}"
-            return url
-
         async def callback(
             response: ClientResponse, session: ClientSession
         ) -> list[dict]:
             """Return the response."""
-            init_response = await response.json()
+            init_response = from_json(await response.read())
 
             if message := init_response.get(  # type: ignore
                 "error"
@@ -94,41 +100,77 @@ class IntrinioHistoricalAttributesFetcher(
                 warnings.warn(message=str(message), category=OpenBBWarning)
                 return []
 
-            symbol = response.url.parts[-2]  # type: ignore
-            tag = response.url.parts[-1]  # type: ignore
-
-            all_data: list = init_response.get("historical_data", [])  # type: ignore
-            all_data = [{**item, "symbol": symbol, "tag": tag} for item in all_data]
+            all_data: list = init_response.get("historical_data") or []  # type: ignore
 
             next_page = init_response.get("next_page", None)  # type: ignore
             while next_page:
                 url = response.url.update_query(next_page=next_page).human_repr()  # type: ignore
-                response_data = await session.get_json(url)
+                page = await session.get(url)
+                page_payload = from_json(await page.read())
 
-                if message := response_data.get("error") or response_data.get("message"):  # type: ignore
+                if message := page_payload.get("error") or page_payload.get("message"):  # type: ignore
                     warnings.warn(message=message, category=OpenBBWarning)
                     return []
 
-                symbol = response.url.parts[-2]  # type: ignore
-                tag = response_data.url.parts[-1]  # type: ignore
-
-                response_data = response_data.get("historical_data", [])  # type: ignore
-                response_data = [
-                    {**item, "symbol": symbol, "tag": tag} for item in response_data
-                ]
+                all_data += page_payload.get("historical_data") or []  # type: ignore
+                next_page = page_payload.get("next_page", None)  # type: ignore
 
-                all_data.extend(response_data)
-                next_page = response_data.get("next_page", None)  # type: ignore
+            # Every page of this url belongs to the same symbol and tag.
+            *_, symbol, tag = response.url.parts  # type: ignore
+            for item in all_data:
+                item["symbol"] = symbol
+                item["tag"] = tag
 
             return all_data
 
+        prefix = f"{base_url}/historical_data/"
+        suffix = f"?{query_str}&api_key={api_key}"
+        tags = query.tag.split(",")
         urls = [
-            generate_url(symbol, tag)
+            f"{prefix}{symbol}/{tag}{suffix}"
             for symbol in query.symbol.split(",")
-            for tag in query.tag.split(",")
+            for tag in tags
         ]
 
-        return await amake_requests(urls, callback, **kwargs)
+        # Every symbol/tag pair is a request; cap how many are in flight at once.
+        semaphore = asyncio.Semaphore(kwargs.pop("max_concurrency", _MAX_CONCURRENCY))
+        use_cache = kwargs.pop("use_cache", False) is True
+        if use_cache:
+            kwargs["session"] = get_cached_session(get_cache_expiry(query.end_date))
+        owns_session = use_cache or "session" not in kwargs
+        session = kwargs.pop("session", None) or await get_async_requests_session(
+            **kwargs
+        )
+
+        async def get_one(url: str) -> list[dict]:
+            """Request one symbol/tag pair once a slot is free."""
+            async with semaphore:
+                return await amake_request(
+                    url, response_callback=callback, session=session, **kwargs
+                )
+
+        try:
+            responses = await asyncio.gather(
+                *[get_one(url) for url in urls], return_exceptions=True
+            )
+        finally:
+            if owns_session:
+                await session.close()
+
+        results: list[dict] = []
+        errors: list[Exception] = []
+        for response in responses:
+            if isinstance(response, UnauthorizedError):
+                raise response
+            if isinstance(response, Exception):
+                errors.append(response)
+            elif response:
+                results.extend(response)
+
+        if errors and not results:
+            raise errors[0]
+
+        return results
 
     @staticmethod
     def transform_data(
@@ -137,4 +179,4 @@ class IntrinioHistoricalAttributesFetcher(
         **kwargs: Any,
     ) -> list[IntrinioHistoricalAttributesData]:
         """Return the transformed data."""
-        return [IntrinioHistoricalAttributesData.model_validate(d) for d in data]
+        return _DATA_ADAPTER.validate_python(data)
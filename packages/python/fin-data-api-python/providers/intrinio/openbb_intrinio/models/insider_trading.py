@@ -16,8 +16,10 @@ from openbb_core.provider.standard_models.insider_trading import (
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
 from openbb_core.provider.utils.helpers import get_querystring
-from openbb_intrinio.utils.helpers import get_data_many
-from pydantic import Field, model_validator
+from openbb_intrinio.utils.helpers import get_cache_expiry, get_data_many
+from pydantic import Field, TypeAdapter, model_validator
+
+_FIVE_YEARS = relativedelta(years=5)
 
 
 class IntrinioInsiderTradingQueryParams(InsiderTradingQueryParams):
@@ -110,11 +112,13 @@ class IntrinioInsiderTradingData(InsiderTradingData):
     @classmethod
     def empty_strings(cls, values):  # pylint: disable=no-self-argument
         """Check for empty strings and replace with None."""
-        return (
-            {k: None if v == "" else v for k, v in values.items()}
-            if isinstance(values, dict)
-            else values
-        )
+        # Most rows have no empty strings; only those need to be rebuilt.
+        if isinstance(values, dict) and "" in values.values():
+            return {k: None if v == "" else v for k, v in values.items()}
+        return values
+
+
+_DATA_ADAPTER = TypeAdapter(list[IntrinioInsiderTradingData])
 
 
 class IntrinioInsiderTradingFetcher(
@@ -130,11 +134,12 @@ class IntrinioInsiderTradingFetcher(
         """Transform the query params."""
         transformed_params = params
 
-        now = datetime.now().date()
-        if params.get("start_date") is None:
-            transformed_params["start_date"] = now - relativedelta(years=5)
-        if params.get("end_date") is None:
-            transformed_params["end_date"] = now
+        if params.get("start_date") is None or params.get("end_date") is None:
+            now = datetime.now().date()
+            if params.get("start_date") is None:
+                transformed_params["start_date"] = now - _FIVE_YEARS
+            if params.get("end_date") is None:
+                transformed_params["end_date"] = now
 
         return IntrinioInsiderTradingQueryParams(**transformed_params)
 
@@ -152,30 +157,33 @@ class IntrinioInsiderTradingFetcher(
         query_str = get_querystring(query.model_dump(by_alias=True), ["symbol"])
         url = f"{base_url}/{query.symbol}/insider_transaction_filings?{query_str}&api_key={api_key}"
 
-        return await get_data_many(url, "transaction_filings", **kwargs)
+        return await get_data_many(
+            url,
+            "transaction_filings",
+            expire_after=get_cache_expiry(query.end_date),
+            **kwargs,
+        )
 
     @staticmethod
     def transform_data(
         query: IntrinioInsiderTradingQueryParams, data: list[dict], **kwargs: Any
     ) -> list[IntrinioInsiderTradingData]:
         """Return the transformed data."""
-        transformed_data: list[dict] = []
-
-        for item in data:
-            transformed_data.extend(
-                [
-                    {
-                        **sub_item,
-                        "filing_date": item["filing_date"],
-                        "filing_url": item["filing_url"],
-                        "symbol": item["issuer_ticker"],
-                        "company_cik": item["issuer_cik"],
-                        "company_name": item["issuer_company"],
-                        "owner_cik": item["owner"]["owner_cik"],
-                        "owner_name": item["owner"]["owner_name"],
-                    }
-                    for sub_item in item["transactions"]
-                ]
-            )
-
-        return [IntrinioInsiderTradingData.model_validate(d) for d in transformed_data]
+
+        def transactions():
+            """Yield each transaction merged with its filing-level fields."""
+            for item in data:
+                filing = {
+                    "filing_date": item["filing_date"],
+                    "filing_url": item["filing_url"],
+                    "symbol": item["issuer_ticker"],
+                    "company_cik": item["issuer_cik"],
+                    "company_name": item["issuer_company"],
+                    "owner_cik": item["owner"]["owner_cik"],
+                    "owner_name": item["owner"]["owner_name"],
+                }
+                for sub_item in item["transactions"]:
+                    yield dict(sub_item, **filing)
+
+        # The adapter consumes the generator directly, so no intermediate list is built.
+        return _DATA_ADAPTER.validate_python(transactions())
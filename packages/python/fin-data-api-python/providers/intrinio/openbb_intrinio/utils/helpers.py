@@ -2,12 +2,13 @@
 
 import asyncio
 import json
+import time
 from datetime import (
     date as dateType,
     timedelta,
 )
 from io import StringIO
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from openbb_core.app.model.abstract.error import OpenBBError
 from openbb_core.provider.utils.errors import EmptyDataError, UnauthorizedError
@@ -17,6 +18,11 @@ from openbb_core.provider.utils.helpers import (
     amake_request,
 )
 from pydantic import BaseModel
+from pydantic_core import from_json
+
+if TYPE_CHECKING:
+    from aiohttp_client_cache import SQLiteBackend
+    from aiohttp_client_cache.session import CachedSession
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -61,7 +67,8 @@ async def response_callback(
     response: ClientResponse, _: ClientSession
 ) -> dict | list[dict]:
     """Use callback for async_request."""
-    data = await response.json()
+    body = await response.read()
+    data = from_json(body) if body.strip() else None
 
     if isinstance(data, dict) and "error" in data:
         message = data.get("message", "")
@@ -84,8 +91,52 @@ async def response_callback(
     return data
 
 
-async def get_data(url: str, **kwargs: Any) -> list | dict:
-    """Get data from Intrinio endpoint."""
+def get_cache_backend(expire_after: int = 3600) -> "SQLiteBackend":
+    """Get the SQLiteBackend for cached Intrinio responses.
+
+    The API key is left out of the cache key, so entries survive a key rotation.
+    """
+    # pylint: disable=import-outside-toplevel
+    from aiohttp_client_cache import SQLiteBackend
+    from openbb_core.app.utils import get_user_cache_directory
+
+    return SQLiteBackend(
+        f"{get_user_cache_directory()}/http/intrinio",
+        expire_after=expire_after,
+        ignored_params=["api_key"],
+    )
+
+
+def get_cached_session(expire_after: int = 3600) -> "CachedSession":
+    """Get a session that serves repeated requests from the on-disk cache."""
+    # pylint: disable=import-outside-toplevel
+    from aiohttp_client_cache.session import CachedSession
+
+    return CachedSession(cache=get_cache_backend(expire_after))
+
+
+def get_cache_expiry(end_date: dateType | None) -> int:
+    """Return how long, in seconds, to cache a response for a query ending on end_date.
+
+    Ranges that closed before today no longer change and are kept for 30 days,
+    while ranges reaching today are kept for an hour.
+    """
+    if end_date is not None and end_date < dateType.today():
+        return 3600 * 24 * 30
+    return 3600
+
+
+async def get_data(
+    url: str, use_cache: bool = False, expire_after: int = 3600, **kwargs: Any
+) -> list | dict:
+    """Get data from Intrinio endpoint.
+
+    If use_cache is True, responses are cached on disk for expire_after seconds.
+    """
+    if use_cache is True:
+        kwargs["session"] = get_cached_session(expire_after)
+        kwargs["with_session"] = False
+
     return await amake_request(url, response_callback=response_callback, **kwargs)
 
 
@@ -129,6 +180,27 @@ async def get_data_one(url: str, **kwargs: Any) -> dict[str, Any]:
     return data
 
 
+class RateLimiter:
+    """Space out requests so that one starts at most every `interval` seconds.
+
+    Unlike a fixed sleep between requests, time already spent waiting on the
+    previous request counts toward the interval.
+    The interval is counted from when the limiter is created.
+    """
+
+    def __init__(self, interval: float):
+        """Initialize the RateLimiter class."""
+        self.interval = interval
+        self._next_start = time.monotonic() + interval
+
+    async def wait(self) -> None:
+        """Wait until the next request is allowed to start."""
+        now = time.monotonic()
+        if self._next_start > now:
+            await asyncio.sleep(self._next_start - now)
+        self._next_start = max(now, self._next_start) + self.interval
+
+
 def get_weekday(date: dateType) -> dateType:
     """Return the weekday date."""
     if date.weekday() in [5, 6]:
@@ -1,9 +1,11 @@
 """Test Intrinio fetchers."""
 
+import asyncio
 from datetime import date
 from unittest import mock
 
 import pytest
+from aiohttp import ClientSession, web
 from openbb_core.app.service.user_service import UserService
 from openbb_intrinio.models.balance_sheet import IntrinioBalanceSheetFetcher
 from openbb_intrinio.models.calendar_ipo import IntrinioCalendarIpoFetcher
@@ -66,6 +68,7 @@ from openbb_intrinio.models.search_attributes import (
 )
 from openbb_intrinio.models.share_statistics import IntrinioShareStatisticsFetcher
 from openbb_intrinio.models.world_news import IntrinioWorldNewsFetcher
+from yarl import URL
 
 test_credentials = UserService().default_user_settings.credentials.model_dump(
     mode="json"
@@ -275,6 +278,72 @@ def test_intrinio_historical_attributes(credentials=test_credentials):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_intrinio_historical_attributes_pagination():
+    """Test that historical attributes keep every page, tag each row and cap requests."""
+    pages = {
+        None: {
+            "historical_data": [{"date": "2022-12-31", "value": 1.0}],
+            "next_page": "p2",
+        },
+        "p2": {
+            "historical_data": [{"date": "2021-12-31", "value": 2.0}],
+            "next_page": None,
+        },
+    }
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response(pages[request.query.get("next_page")])
+
+    app = web.Application()
+    app.router.add_get("/historical_data/{symbol}/{tag}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    local = URL(f"http://127.0.0.1:{runner.addresses[0][1]}")
+
+    class LocalSession(ClientSession):
+        """Send every request to the local server instead of Intrinio."""
+
+        async def _request(self, method, str_or_url, **kwargs):
+            url = URL(str_or_url).with_scheme("http").with_host(local.host)
+            return await super()._request(method, url.with_port(local.port), **kwargs)
+
+    fetcher = IntrinioHistoricalAttributesFetcher()
+    query = fetcher.transform_query(
+        {
+            "symbol": "AAPL,MSFT,GOOG",
+            "tag": "ebit,marketcap",
+            "frequency": "yearly",
+            "start_date": date(2013, 1, 1),
+            "end_date": date(2023, 1, 1),
+        }
+    )
+    try:
+        async with LocalSession() as session:
+            data = await fetcher.aextract_data(
+                query, {"intrinio_api_key": "MOCK"}, session=session, max_concurrency=2
+            )
+    finally:
+        await runner.cleanup()
+
+    assert max_in_flight == 2
+    assert [(d["symbol"], d["tag"], d["value"]) for d in data] == [
+        (symbol, tag, value)
+        for symbol in ("AAPL", "MSFT", "GOOG")
+        for tag in ("ebit", "marketcap")
+        for value in (1.0, 2.0)
+    ]
+
+
 @pytest.mark.record_http
 def test_intrinio_latest_attributes(credentials=test_credentials):
     """Test latest attributes fetcher."""
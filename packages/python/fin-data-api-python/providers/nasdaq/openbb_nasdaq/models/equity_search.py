@@ -2,6 +2,7 @@
 
 # pylint: disable=unused-argument
 
+import re
 from typing import Any
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -9,7 +10,7 @@ from openbb_core.provider.standard_models.equity_search import (
     EquitySearchData,
     EquitySearchQueryParams,
 )
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 
 class NasdaqEquitySearchQueryParams(EquitySearchQueryParams):
@@ -84,6 +85,9 @@ class NasdaqEquitySearchData(EquitySearchData):
     )
 
 
+_DATA_ADAPTER = TypeAdapter(list[NasdaqEquitySearchData])
+
+
 class NasdaqEquitySearchFetcher(
     Fetcher[NasdaqEquitySearchQueryParams, list[NasdaqEquitySearchData]]
 ):
@@ -117,7 +121,6 @@ class NasdaqEquitySearchFetcher(
         """Transform the data and filter the results."""
         # pylint: disable=import-outside-toplevel
         from io import StringIO  # noqa
-        from numpy import nan
         from pandas import read_csv
 
         directory = read_csv(StringIO(data), sep="|").iloc[:-1]
@@ -127,22 +130,28 @@ class NasdaqEquitySearchFetcher(
         if query.is_etf is False:
             directory = directory[directory["ETF"] == "N"]
 
-        directory = directory[
-            ~directory["Security Name"].str.contains("test", case=False)
-        ]
+        if "Test Issue" in directory.columns:
+            directory = directory[directory["Test Issue"] != "Y"]
+        else:
+            directory = directory[
+                ~directory["Security Name"].str.contains("test", case=False)
+            ]
 
         if query.query:
+            # Search all four columns in one regex pass. Each column is its own line,
+            # so with MULTILINE, ^ and $ still anchor to a single column's value.
+            haystack = directory["Symbol"].fillna("")
+            for column in ("Security Name", "CQS Symbol", "NASDAQ Symbol"):
+                haystack = haystack + "\n" + directory[column].fillna("")
             directory = directory[
-                directory["Symbol"].str.contains(query.query, case=False)
-                | directory["Security Name"].str.contains(query.query, case=False)
-                | directory["CQS Symbol"].str.contains(query.query, case=False)
-                | directory["NASDAQ Symbol"].str.contains(query.query, case=False)
+                haystack.str.contains(query.query, case=False, flags=re.MULTILINE)
             ]
         directory["Market Category"] = directory["Market Category"].replace(" ", None)
+        # Mask missing values to None in one pass instead of scanning for NaN to replace.
         results = (
-            directory.infer_objects(copy=False)
-            .replace({nan: None})
+            directory.astype(object)
+            .where(directory.notna(), None)
             .to_dict(orient="records")
         )
 
-        return [NasdaqEquitySearchData.model_validate(d) for d in results]
+        return _DATA_ADAPTER.validate_python(results)
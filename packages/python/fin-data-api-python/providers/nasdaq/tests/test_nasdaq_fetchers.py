@@ -45,6 +45,32 @@ def test_nasdaq_equity_search_fetcher(credentials=test_credentials):
     assert result is None
 
 
+def test_nasdaq_equity_search_regex_query():
+    """Test that the search query is matched as a regex against each column."""
+    header = (
+        "Nasdaq Traded|Symbol|Security Name|Listing Exchange|Market Category|ETF|"
+        "Round Lot Size|Test Issue|Financial Status|CQS Symbol|NASDAQ Symbol|NextShares"
+    )
+    rows = [
+        "Y|AAPL|Apple Inc. - Common Stock|Q|Q|N|100|N|N||AAPL|N",
+        "Y|AA|Alcoa Corporation Common Stock|N| |N|100|N||AA|AA|N",
+        "Y|BAAX|Baax Holdings Common Stock|N| |N|100|N||BAAX|BAAX|N",
+        "Y|MSFT|Microsoft Corporation - Common Stock|Q|Q|N|100|N|N||MSFT|N",
+    ]
+    data = "\n".join([header, *rows, "File Creation Time: 0101202500:00|||||||||||"])
+    fetcher = NasdaqEquitySearchFetcher()
+
+    def search(text):
+        query = fetcher.transform_query({"query": text, "is_etf": False})
+        return [d.symbol for d in fetcher.transform_data(query, data)]
+
+    assert search("^aa") == ["AAPL", "AA"]
+    assert search("^AA$") == ["AA"]
+    assert search("corporation") == ["AA", "MSFT"]
+    assert search("Stock$") == ["AAPL", "AA", "BAAX", "MSFT"]
+    assert search("AAPL.*Apple") == []
+
+
 @pytest.mark.record_http
 def test_nasdaq_economic_calendar_fetcher(credentials=test_credentials):
     """Test the Nasdaq Economic Calendar fetcher."""
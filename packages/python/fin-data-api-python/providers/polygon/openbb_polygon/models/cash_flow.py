@@ -2,8 +2,9 @@
 
 # pylint: disable=unused-argument
 
-from datetime import date as dateType
+from operator import itemgetter
 from typing import Any, Literal
+from urllib.parse import urlencode
 
 from openbb_core.provider.abstract.fetcher import Fetcher
 from openbb_core.provider.standard_models.cash_flow import (
@@ -11,10 +12,15 @@ from openbb_core.provider.standard_models.cash_flow import (
     CashFlowStatementQueryParams,
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
-from pydantic import Field, model_validator
+from openbb_polygon.models.financial_statements import (
+    PolygonFinancialStatementsQueryParams,
+)
+from pydantic import Field, TypeAdapter
 
 
-class PolygonCashFlowStatementQueryParams(CashFlowStatementQueryParams):
+class PolygonCashFlowStatementQueryParams(
+    PolygonFinancialStatementsQueryParams, CashFlowStatementQueryParams
+):
     """Polygon Cash Flow Statement Query.
 
     Source: https://polygon.io/docs/stocks#!/get_vx_reference_financials
@@ -31,53 +37,10 @@ class PolygonCashFlowStatementQueryParams(CashFlowStatementQueryParams):
         default="annual",
         description=QUERY_DESCRIPTIONS.get("period", ""),
     )
-    filing_date: dateType | None = Field(
-        default=None, description="Filing date of the financial statement."
-    )
-    filing_date_lt: dateType | None = Field(
-        default=None, description="Filing date less than the given date."
-    )
-    filing_date_lte: dateType | None = Field(
-        default=None,
-        description="Filing date less than or equal to the given date.",
-    )
-    filing_date_gt: dateType | None = Field(
-        default=None,
-        description="Filing date greater than the given date.",
-    )
-    filing_date_gte: dateType | None = Field(
-        default=None,
-        description="Filing date greater than or equal to the given date.",
-    )
-    period_of_report_date: dateType | None = Field(
-        default=None, description="Period of report date of the financial statement."
-    )
-    period_of_report_date_lt: dateType | None = Field(
-        default=None,
-        description="Period of report date less than the given date.",
-    )
-    period_of_report_date_lte: dateType | None = Field(
-        default=None,
-        description="Period of report date less than or equal to the given date.",
-    )
-    period_of_report_date_gt: dateType | None = Field(
-        default=None,
-        description="Period of report date greater than the given date.",
-    )
-    period_of_report_date_gte: dateType | None = Field(
-        default=None,
-        description="Period of report date greater than or equal to the given date.",
-    )
     include_sources: bool = Field(
         default=False,
         description="Whether to include the sources of the financial statement.",
     )
-    order: Literal["asc", "desc"] | None = Field(
-        default=None, description="Order of the financial statement."
-    )
-    sort: Literal["filing_date", "period_of_report_date"] | None = Field(
-        default=None, description="Sort of the financial statement."
-    )
 
 
 class PolygonCashFlowStatementData(CashFlowStatementData):
@@ -124,15 +87,9 @@ class PolygonCashFlowStatementData(CashFlowStatementData):
     )
     net_cash_flow: float | None = Field(description="Net cash flow.", default=None)
 
-    @model_validator(mode="before")
-    @classmethod
-    def replace_zero(cls, values):
-        """Check for zero values and replace with None."""
-        return (
-            {k: None if v == 0 else v for k, v in values.items()}
-            if isinstance(values, dict)
-            else values
-        )
+
+_STATEMENT_FIELDS = itemgetter("end_date", "fiscal_period", "financials")
+_DATA_ADAPTER = TypeAdapter(list[PolygonCashFlowStatementData])
 
 
 class PolygonCashFlowStatementFetcher(
@@ -156,7 +113,6 @@ class PolygonCashFlowStatementFetcher(
     ) -> dict:
         """Return the raw data from the Intrinio endpoint."""
         # pylint: disable=import-outside-toplevel
-        from openbb_core.provider.utils.helpers import get_querystring
         from openbb_polygon.utils.helpers import get_data_many
 
         api_key = credentials.get("polygon_api_key") if credentials else ""
@@ -168,16 +124,15 @@ class PolygonCashFlowStatementFetcher(
             "ttm": "ttm",
         }
         query.limit = query.limit or 5
-        query_string = get_querystring(
-            query.model_dump(by_alias=True), ["ticker", "timeframe"]
-        )
-
-        if query.symbol.isdigit():
-            query_string = f"cik={query.symbol}&timeframe={period_dict[query.period]}&{query_string}"
-        else:
-            query_string = f"ticker={query.symbol}&timeframe={period_dict[query.period]}&{query_string}"
-
-        request_url = f"{base_url}?{query_string}&apiKey={api_key}"
+        params = {
+            "cik" if query.symbol.isdigit() else "ticker": query.symbol,
+            "timeframe": period_dict[query.period],
+            **query.model_dump(
+                by_alias=True, exclude_none=True, exclude={"symbol", "period"}
+            ),
+            "apiKey": api_key,
+        }
+        request_url = f"{base_url}?{urlencode(params)}"
 
         return await get_data_many(request_url, "results", **kwargs)  # type: ignore
 
@@ -188,15 +143,15 @@ class PolygonCashFlowStatementFetcher(
         **kwargs: Any,
     ) -> list[PolygonCashFlowStatementData]:
         """Return the transformed data."""
-        transformed_data: list[PolygonCashFlowStatementData] = []
+        rows: list[dict] = []
 
-        for item in data:
+        for end_date, fiscal_period, financials in map(_STATEMENT_FIELDS, data):
             sub_data = {
-                key: value["value"]
-                for key, value in item["financials"]["cash_flow_statement"].items()
+                key: value["value"] or None
+                for key, value in financials["cash_flow_statement"].items()
             }
-            sub_data["period_ending"] = item["end_date"]
-            sub_data["fiscal_period"] = item["fiscal_period"]
-            transformed_data.append(PolygonCashFlowStatementData(**sub_data))
+            sub_data["period_ending"] = end_date
+            sub_data["fiscal_period"] = fiscal_period
+            rows.append(sub_data)
 
-        return transformed_data
+        return _DATA_ADAPTER.validate_python(rows)
@@ -0,0 +1,71 @@
+"""Polygon Financial Statements Shared Query Parameters."""
+
+from datetime import date as dateType
+from typing import Literal
+
+from openbb_core.provider.abstract.query_params import QueryParams
+from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from pydantic import Field
+
+
+class PolygonFinancialStatementsQueryParams(QueryParams):
+    """Polygon Financial Statements Query.
+
+    Shared by the balance sheet, cash flow and income statement queries, which
+    list it before their standard model so the standard fields come first.
+    Each statement narrows the period choices and the include_sources default.
+
+    Source: https://polygon.io/docs/stocks#!/get_vx_reference_financials
+    """
+
+    period: str = Field(
+        default="annual",
+        description=QUERY_DESCRIPTIONS.get("period", ""),
+    )
+    filing_date: dateType | None = Field(
+        default=None, description="Filing date of the financial statement."
+    )
+    filing_date_lt: dateType | None = Field(
+        default=None, description="Filing date less than the given date."
+    )
+    filing_date_lte: dateType | None = Field(
+        default=None,
+        description="Filing date less than or equal to the given date.",
+    )
+    filing_date_gt: dateType | None = Field(
+        default=None,
+        description="Filing date greater than the given date.",
+    )
+    filing_date_gte: dateType | None = Field(
+        default=None,
+        description="Filing date greater than or equal to the given date.",
+    )
+    period_of_report_date: dateType | None = Field(
+        default=None, description="Period of report date of the financial statement."
+    )
+    period_of_report_date_lt: dateType | None = Field(
+        default=None,
+        description="Period of report date less than the given date.",
+    )
+    period_of_report_date_lte: dateType | None = Field(
+        default=None,
+        description="Period of report date less than or equal to the given date.",
+    )
+    period_of_report_date_gt: dateType | None = Field(
+        default=None,
+        description="Period of report date greater than the given date.",
+    )
+    period_of_report_date_gte: dateType | None = Field(
+        default=None,
+        description="Period of report date greater than or equal to the given date.",
+    )
+    include_sources: bool | None = Field(
+        default=None,
+        description="Whether to include the sources of the financial statement.",
+    )
+    order: Literal["asc", "desc"] | None = Field(
+        default=None, description="Order of the financial statement."
+    )
+    sort: Literal["filing_date", "period_of_report_date"] | None = Field(
+        default=None, description="Sort of the financial statement."
+    )
@@ -2,7 +2,6 @@
 
 # pylint: disable=unused-argument
 
-from datetime import date as dateType
 from typing import Any, Literal
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -11,10 +10,15 @@ from openbb_core.provider.standard_models.income_statement import (
     IncomeStatementQueryParams,
 )
 from openbb_core.provider.utils.descriptions import QUERY_DESCRIPTIONS
+from openbb_polygon.models.financial_statements import (
+    PolygonFinancialStatementsQueryParams,
+)
 from pydantic import Field, model_validator
 
 
-class PolygonIncomeStatementQueryParams(IncomeStatementQueryParams):
+class PolygonIncomeStatementQueryParams(
+    PolygonFinancialStatementsQueryParams, IncomeStatementQueryParams
+):
     """Polygon Income Statement Query.
 
     Source: https://polygon.io/docs/stocks#!/get_vx_reference_financials
@@ -30,53 +34,10 @@ class PolygonIncomeStatementQueryParams(IncomeStatementQueryParams):
         default="annual",
         description=QUERY_DESCRIPTIONS.get("period", ""),
     )
-    filing_date: dateType | None = Field(
-        default=None, description="Filing date of the financial statement."
-    )
-    filing_date_lt: dateType | None = Field(
-        default=None, description="Filing date less than the given date."
-    )
-    filing_date_lte: dateType | None = Field(
-        default=None,
-        description="Filing date less than or equal to the given date.",
-    )
-    filing_date_gt: dateType | None = Field(
-        default=None,
-        description="Filing date greater than the given date.",
-    )
-    filing_date_gte: dateType | None = Field(
-        default=None,
-        description="Filing date greater than or equal to the given date.",
-    )
-    period_of_report_date: dateType | None = Field(
-        default=None, description="Period of report date of the financial statement."
-    )
-    period_of_report_date_lt: dateType | None = Field(
-        default=None,
-        description="Period of report date less than the given date.",
-    )
-    period_of_report_date_lte: dateType | None = Field(
-        default=None,
-        description="Period of report date less than or equal to the given date.",
-    )
-    period_of_report_date_gt: dateType | None = Field(
-        default=None,
-        description="Period of report date greater than the given date.",
-    )
-    period_of_report_date_gte: dateType | None = Field(
-        default=None,
-        description="Period of report date greater than or equal to the given date.",
-    )
     include_sources: bool | None = Field(
         default=None,
         description="Whether to include the sources of the financial statement.",
     )
-    order: Literal["asc", "desc"] | None = Field(
-        default=None, description="Order of the financial statement."
-    )
-    sort: Literal["filing_date", "period_of_report_date"] | None = Field(
-        default=None, description="Sort of the financial statement."
-    )
 
 
 class PolygonIncomeStatementData(IncomeStatementData):
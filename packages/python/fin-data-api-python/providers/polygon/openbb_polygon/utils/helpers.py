@@ -9,14 +9,20 @@ from openbb_core.provider.utils.helpers import (
     ClientSession,
     amake_request,
 )
+from pydantic_core import from_json
 
 
 async def response_callback(response: ClientResponse, _: ClientSession) -> dict | list:
     """Use callback for make_request."""
-    data = await response.json()  # type: ignore
+    body = await response.read()
+    data = from_json(body) if body.strip() else None
 
     if response.status != 200:
-        message = data.get("error") or data.get("message")
+        message = (
+            data.get("error") or data.get("message")
+            if isinstance(data, dict)
+            else response.reason
+        )
         raise OpenBBError(f"Error in Polygon request -> {message}")
 
     if isinstance(data, dict) and data.get("status") == "NOT_AUTHORIZED":
@@ -28,8 +34,27 @@ async def response_callback(response: ClientResponse, _: ClientSession) -> dict
     return data
 
 
-async def get_data(url: str, **kwargs: Any) -> list | dict:
-    """Get data from Polygon endpoint."""
+async def get_data(
+    url: str, use_cache: bool = False, expire_after: int = 3600, **kwargs: Any
+) -> list | dict:
+    """Get data from Polygon endpoint.
+
+    If use_cache is True, responses are cached on disk for expire_after seconds.
+    """
+    if use_cache is True:
+        # pylint: disable=import-outside-toplevel
+        from aiohttp_client_cache import SQLiteBackend
+        from aiohttp_client_cache.session import CachedSession
+        from openbb_core.app.utils import get_user_cache_directory
+
+        backend = SQLiteBackend(
+            f"{get_user_cache_directory()}/http/polygon",
+            expire_after=expire_after,
+            ignored_params=["apiKey"],
+        )
+        kwargs["session"] = CachedSession(cache=backend)
+        kwargs["with_session"] = False
+
     return await amake_request(url, response_callback=response_callback, **kwargs)
 
 